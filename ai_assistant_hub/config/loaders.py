@@ -1,64 +1,231 @@
 """Helpers for building the settings context."""
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import os
+import re
+import stat
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
-    from dotenv import dotenv_values
+    import orjson
 except ImportError:  # pragma: no cover - optional dependency
-    dotenv_values = None  # type: ignore
+    orjson = None  # type: ignore
+
+CONFIG_CACHE_ENV_VAR = "AI_HUB_CACHE_CONFIG"
+
+# TOOL_<NAME>_ENABLED, or TOOL_<NAME>_CONFIG__<KEY> split at the first "_CONFIG__".
+_TOOL_KEY_RE = re.compile(
+    r"TOOL_(?:(?P<toggle>.*)_ENABLED|(?P<tool>.*?)_CONFIG__(?P<key>.*))",
+    re.DOTALL,
+)
+_NUMERIC_PREFIXES = frozenset("+-.0123456789")
+_YAML_SUFFIXES = frozenset((".yaml", ".yml"))
+
+
+_ENV_SNAPSHOT: Optional[Dict[str, Any]] = None
+_ENV_SNAPSHOT_LOCK = threading.Lock()
 
 
 def build_base_config() -> Dict[str, Any]:
-    """Return base configuration sourced from environment variables and `.env`."""
+    """Return base configuration sourced from environment variables and `.env`.
+
+    The environment is read and coerced once per process; call
+    :func:`invalidate_env_cache` after changing it.
+    """
+
+    global _ENV_SNAPSHOT
+    snapshot = _ENV_SNAPSHOT
+    if snapshot is None:
+        with _ENV_SNAPSHOT_LOCK:
+            snapshot = _ENV_SNAPSHOT
+            if snapshot is None:
+                snapshot = _ENV_SNAPSHOT = _read_environment()
+    return dict(snapshot)
+
 
+def invalidate_env_cache() -> None:
+    """Discard the environment snapshot used by :func:`build_base_config`."""
+
+    global _ENV_SNAPSHOT
+    with _ENV_SNAPSHOT_LOCK:
+        _ENV_SNAPSHOT = None
+
+
+def _read_environment() -> Dict[str, Any]:
     base: Dict[str, Any] = {}
     env_file = Path(os.getenv("ENV_FILE", ".env"))
-    if dotenv_values and env_file.exists():
-        base.update(dotenv_values(str(env_file)))
+    base.update(_load_dotenv(env_file))
     base.update(os.environ)
-    normalized = {k.upper(): _coerce_value(v) for k, v in base.items() if v is not None}
-    return normalized
+    return {k.upper(): _coerce_value(v) for k, v in base.items() if v is not None}
 
 
-def load_file_config(path: Any) -> Dict[str, Any]:
-    """Load configuration from a JSON or YAML file if available."""
+def _load_dotenv(env_file: Path) -> Dict[str, Optional[str]]:
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_dotenv_cached(str(env_file), mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dotenv_cached(path: str, mtime_ns: int) -> Dict[str, Optional[str]]:
+    dotenv_values = _dotenv_loader()
+    if dotenv_values is None:
+        return {}
+    return dict(dotenv_values(path))
+
+
+# Optional dependencies are imported on first use so startups that never read
+# a `.env` or YAML file skip their import cost.
+@functools.lru_cache(maxsize=None)
+def _dotenv_loader() -> Optional[Callable[[str], Dict[str, Optional[str]]]]:
+    try:
+        from dotenv import dotenv_values
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return dotenv_values
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_module() -> Any:
+    try:
+        import yaml  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return yaml
+
+
+def load_file_config(path: Any, *, use_sidecar: Any = None) -> Dict[str, Any]:
+    """Load configuration from a JSON or YAML file if available.
+
+    ``use_sidecar`` enables the JSON sidecar cache for YAML files; when omitted
+    the ``AI_HUB_CACHE_CONFIG`` process environment variable decides.
+    """
 
     if not path:
         return {}
 
     file_path = Path(str(path))
-    if not file_path.exists():
+    try:
+        file_stat = file_path.stat()
+    except OSError:
         return {}
 
-    text = file_path.read_text()
-    if file_path.suffix.lower() in {".yaml", ".yml"}:
-        try:
-            import yaml  # type: ignore
-        except ImportError:  # pragma: no cover - optional dependency
-            return {}
-        data = yaml.safe_load(text) or {}
-    else:
-        data = json.loads(text)
+    if file_path.suffix.lower() not in _YAML_SUFFIXES:
+        # Decoding JSON is cheaper than deep-copying a cached tree, so it is not memoised.
+        return _normalize_file_config(_loads_json(file_path), str(file_path))
+
+    if use_sidecar is None:
+        use_sidecar = os.getenv(CONFIG_CACHE_ENV_VAR, "")
+
+    # Unchanged YAML files (same mtime and size) are served from the parse cache.
+    # The cached tree is deep-copied so callers can never mutate the cache entry.
+    resolved = str(file_path.resolve())
+    return copy.deepcopy(
+        _parse_yaml_file(
+            resolved,
+            str(file_path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            stat.S_IMODE(file_stat.st_mode),
+            _coerce_bool(use_sidecar),
+        )
+    )
+
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(
+    resolved: str, display_path: str, mtime_ns: int, size: int, mode: int, use_sidecar: bool
+) -> Dict[str, Any]:
+    data = _load_yaml_config(Path(resolved), (mtime_ns, size), mode, use_sidecar)
+    if data is None:
+        return {}
+    return _normalize_file_config(data, display_path)
+
+
+def _normalize_file_config(data: Any, display_path: str) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return {}
 
-    data.setdefault("CONFIG_FILE", str(file_path))
+    data.setdefault("CONFIG_FILE", display_path)
     return {k.upper(): v for k, v in data.items()}
 
 
+def _load_yaml_config(file_path: Path, source: Tuple[int, int], mode: int, use_sidecar: bool) -> Any:
+    """Parse a YAML config, reusing a matching JSON sidecar when enabled.
+
+    ``source`` is the YAML's ``(st_mtime_ns, st_size)``; a sidecar is only used
+    when it was written from exactly that version of the file. Returns ``None``
+    when PyYAML is unavailable and no usable sidecar exists.
+    """
+
+    sidecar = file_path.with_name(f"{file_path.name}.cache.json")
+    if use_sidecar:
+        try:
+            cached = _loads_json(sidecar)
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("source") == list(source):
+            return cached.get("data")
+
+    yaml = _yaml_module()
+    if yaml is None:
+        return None
+    # Prefer the libyaml-backed loader when PyYAML was built against it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(file_path.read_text(), Loader=loader) or {}
+
+    if use_sidecar:
+        _write_sidecar(sidecar, data, source, mode)
+    return data
+
+
+def _loads_json(file_path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    return json.loads(file_path.read_text())
+
+
+def _write_sidecar(sidecar: Path, data: Any, source: Tuple[int, int], mode: int) -> None:
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        payload = json.dumps({"source": list(source), "data": data})
+        # json.dumps stringifies non-str keys (80 -> "80", True -> "true"), so
+        # only write a sidecar that decodes back to exactly the parsed YAML.
+        if json.loads(payload)["data"] != data:
+            return
+        # The sidecar holds the same secrets as the YAML, so it is created
+        # private and then given the YAML's own permission bits.
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as handle:
+            handle.write(payload)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError, ValueError):
+        # Values JSON cannot represent (e.g. YAML timestamps) or a read-only
+        # directory simply mean no sidecar; the YAML stays authoritative.
+        tmp_path.unlink(missing_ok=True)
+
+
 def merge_dicts(base: Dict[str, Any], overrides: Dict[str, Any]) -> None:
     """Merge overrides into base dict recursively."""
 
-    for key, value in overrides.items():
-        if isinstance(value, dict) and isinstance(base.get(key), dict):
-            merge_dicts(base[key], value)  # type: ignore[index]
-        else:
-            base[key] = value
+    # An explicit stack keeps deeply nested configs clear of the recursion limit.
+    stack = [(base, overrides)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                current = target.get(key)
+                if isinstance(current, dict):
+                    stack.append((current, value))
+                    continue
+            target[key] = value
 
 
 def extract_tool_configs(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
@@ -68,26 +235,27 @@ def extract_tool_configs(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     for key, value in config.items():
         if not key.startswith("TOOL_"):
             continue
-        remainder = key[len("TOOL_") :]
-        if remainder.endswith("_ENABLED"):
-            tool_name = remainder[: -len("_ENABLED")].lower()
-            entry = tools.setdefault(tool_name, {"enabled": True, "config": {}})
+        match = _TOOL_KEY_RE.fullmatch(key)
+        if match is None:
+            if isinstance(value, dict):
+                tool_entry = tools.setdefault(key[len("TOOL_") :].lower(), {"enabled": True, "config": {}})
+                merge_dicts(tool_entry, value)
+        elif match.group("toggle") is not None:
+            entry = tools.setdefault(match.group("toggle").lower(), {"enabled": True, "config": {}})
             entry["enabled"] = _coerce_bool(value)
-        elif "_CONFIG__" in remainder:
-            tool_name, config_key = remainder.split("_CONFIG__", 1)
-            tool_entry = tools.setdefault(tool_name.lower(), {"enabled": True, "config": {}})
-            tool_entry["config"][config_key.lower()] = value
-        elif isinstance(value, dict):
-            tool_entry = tools.setdefault(remainder.lower(), {"enabled": True, "config": {}})
-            merge_dicts(tool_entry, value)
+        else:
+            tool_entry = tools.setdefault(match.group("tool").lower(), {"enabled": True, "config": {}})
+            tool_entry["config"][match.group("key").lower()] = value
     return tools
 
 
 def _coerce_value(value: Any) -> Any:
-    if isinstance(value, str):
-        lowered = value.lower()
-        if lowered in {"true", "false"}:
-            return lowered == "true"
+    if not isinstance(value, str) or not value:
+        return value
+    first = value[0]
+    # Only attempt numeric parsing when the value could plausibly be a number,
+    # so ordinary strings never pay for raising and catching ValueError.
+    if first in _NUMERIC_PREFIXES:
         try:
             return int(value)
         except ValueError:
@@ -95,6 +263,10 @@ def _coerce_value(value: Any) -> Any:
                 return float(value)
             except ValueError:
                 return value
+    if first in "tTfF":
+        lowered = value.lower()
+        if lowered in {"true", "false"}:
+            return lowered == "true"
     return value
 
 
@@ -108,6 +280,7 @@ def _coerce_bool(value: Any) -> bool:
 
 __all__ = [
     "build_base_config",
+    "invalidate_env_cache",
     "load_file_config",
     "merge_dicts",
     "extract_tool_configs",
@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field
 
 from . import loaders
 
+_RESERVED_KEYS = frozenset(("APP_NAME", "LOG_LEVEL", "CONFIG_FILE"))
+
 
 class ToolToggle(BaseModel):
     """Configuration fragment representing a tool's enablement state."""
@@ -39,25 +41,32 @@ def load_settings(*, config_path: Optional[Path] = None) -> Settings:
     """Load settings using environment variables and an optional config file."""
 
     merged: Dict[str, Any] = loaders.build_base_config()
-    file_config = loaders.load_file_config(config_path or merged.get("CONFIG_FILE"))
+    file_config = loaders.load_file_config(
+        config_path or merged.get("CONFIG_FILE"),
+        use_sidecar=merged.get(loaders.CONFIG_CACHE_ENV_VAR, False),
+    )
     loaders.merge_dicts(merged, file_config)
 
     enabled_tools = _build_tool_toggles(loaders.extract_tool_configs(merged))
     extra = _extract_extra_fields(merged)
 
-    return Settings(
-        app_name=merged.get("APP_NAME", Settings.model_fields["app_name"].default),
-        log_level=merged.get("LOG_LEVEL", Settings.model_fields["log_level"].default),
-        enabled_tools=enabled_tools,
-        config_file=_coerce_path(file_config.get("CONFIG_FILE")) if isinstance(file_config, Mapping) else None,
-        extra=extra,
-    )
+    payload: Dict[str, Any] = {
+        "app_name": merged.get("APP_NAME"),
+        "log_level": merged.get("LOG_LEVEL"),
+        "enabled_tools": enabled_tools,
+        "config_file": _coerce_path(file_config.get("CONFIG_FILE")) if isinstance(file_config, Mapping) else None,
+        "extra": extra,
+    }
+    # Missing values are dropped so the model's own defaults apply.
+    return Settings.model_validate({key: value for key, value in payload.items() if value is not None})
 
 
 def _build_tool_toggles(raw: Mapping[str, Mapping[str, Any]]) -> Dict[str, ToolToggle]:
+    # ``raw`` comes from ``loaders.extract_tool_configs`` and is already coerced
+    # to the right types, so field validation can be skipped.
     toggles: Dict[str, ToolToggle] = {}
     for name, config in raw.items():
-        toggles[name] = ToolToggle(
+        toggles[name] = ToolToggle.model_construct(
             enabled=bool(config.get("enabled", True)),
             config=dict(config.get("config", {})),
         )
@@ -65,8 +74,7 @@ def _build_tool_toggles(raw: Mapping[str, Mapping[str, Any]]) -> Dict[str, ToolT
 
 
 def _extract_extra_fields(config: Mapping[str, Any]) -> Dict[str, Any]:
-    reserved = {"APP_NAME", "LOG_LEVEL", "CONFIG_FILE"}
-    return {key: value for key, value in config.items() if key not in reserved and not key.startswith("TOOL_")}
+    return {key: value for key, value in config.items() if key not in _RESERVED_KEYS and not key.startswith("TOOL_")}
 
 
 def _coerce_path(value: Any) -> Optional[Path]:
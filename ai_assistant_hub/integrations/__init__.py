@@ -1,8 +1,37 @@
 """Integration adapters used by MCP tools."""
 
-from .weather import WeatherAdapter, WeatherConfig
-from .github import GitHubIssuesAdapter, GitHubIssuesConfig
-from .slack import SlackAdapter, SlackConfig
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checkers only
+    from .weather import WeatherAdapter, WeatherConfig
+    from .github import GitHubIssuesAdapter, GitHubIssuesConfig
+    from .slack import SlackAdapter, SlackConfig
+
+# Adapters are imported on first access, so loading one tool does not import
+# every integration module.
+_EXPORTS = {
+    "WeatherAdapter": ".weather",
+    "WeatherConfig": ".weather",
+    "GitHubIssuesAdapter": ".github",
+    "GitHubIssuesConfig": ".github",
+    "SlackAdapter": ".slack",
+    "SlackConfig": ".slack",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "WeatherAdapter",
@@ -12,4 +41,3 @@ __all__ = [
     "SlackAdapter",
     "SlackConfig",
 ]
-
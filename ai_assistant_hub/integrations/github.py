@@ -1,6 +1,7 @@
 """GitHub integration adapter."""
 from __future__ import annotations
 
+import operator
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -37,6 +38,9 @@ class GitHubIssuesAdapter:
             headers=headers,
         )
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     async def ensure_repository(self, owner: str, repo: str) -> None:
         try:
             await self.client.request("GET", f"/repos/{owner}/{repo}")
@@ -76,25 +80,33 @@ class GitHubIssuesAdapter:
             params=params,
         )
 
-        issues: List[Dict[str, Any]] = []
-        for issue in issues_response:
-            if "pull_request" in issue:
-                continue
-            issues.append(
-                {
-                    "number": issue.get("number"),
-                    "title": issue.get("title"),
-                    "state": issue.get("state"),
-                    "url": issue.get("html_url"),
-                    "body": (issue.get("body", "") or "")[:500],
-                    "created_at": issue.get("created_at"),
-                    "updated_at": issue.get("updated_at"),
-                    "labels": [label.get("name") for label in issue.get("labels", [])],
-                    "user": issue.get("user", {}).get("login"),
-                    "assignees": [assignee.get("login") for assignee in issue.get("assignees", [])],
-                }
-            )
-        return issues
+        return [_project_issue(issue) for issue in issues_response if "pull_request" not in issue]
+
+
+_BODY_PREVIEW_CHARS = 500
+_label_name = operator.itemgetter("name")
+_user_login = operator.itemgetter("login")
+
+
+def _project_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a GitHub issue payload to the fields exposed by the tool."""
+
+    get = issue.get
+    body = get("body") or ""
+    if len(body) > _BODY_PREVIEW_CHARS:
+        body = body[:_BODY_PREVIEW_CHARS]
+    return {
+        "number": get("number"),
+        "title": get("title"),
+        "state": get("state"),
+        "url": get("html_url"),
+        "body": body,
+        "created_at": get("created_at"),
+        "updated_at": get("updated_at"),
+        "labels": list(map(_label_name, get("labels") or ())),
+        "user": (get("user") or {}).get("login"),
+        "assignees": list(map(_user_login, get("assignees") or ())),
+    }
 
 
 __all__ = ["GitHubIssuesAdapter", "GitHubIssuesConfig"]
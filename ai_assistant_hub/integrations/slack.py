@@ -1,7 +1,8 @@
 """Slack integration adapter."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from pydantic import BaseModel, Field
 
@@ -10,6 +11,10 @@ from ..utils.errors import ToolExecutionError
 from ..utils.http import ResilientAsyncHTTPClient
 
 
+_TS_STRIP = str.maketrans("", "", ".")
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class SlackConfig(BaseModel):
     """Configuration values for Slack messaging integration."""
 
@@ -36,6 +41,9 @@ class SlackAdapter:
             headers=headers,
         )
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     async def post_message(
         self,
         *,
@@ -53,8 +61,8 @@ class SlackAdapter:
             error_msg = response.get("error", "Unknown error")
             raise ToolExecutionError(f"Slack API error: {error_msg}")
 
-        message_data = response.get("message", {})
-        channel_data = response.get("channel", {})
+        message_data = response.get("message") or _EMPTY
+        channel_data = response.get("channel") or _EMPTY
         channel_id = channel_data if isinstance(channel_data, str) else channel_data.get("id", channel)
         channel_name = None
         if isinstance(channel_data, dict) and channel_data.get("name"):
@@ -63,7 +71,7 @@ class SlackAdapter:
         permalink = None
         message_ts = message_data.get("ts", "")
         if message_ts and channel_id:
-            permalink = f"https://slack.com/archives/{channel_id}/p{message_ts.replace('.', '')}"
+            permalink = f"https://slack.com/archives/{channel_id}/p{message_ts.translate(_TS_STRIP)}"
 
         return {
             "message_ts": message_ts,
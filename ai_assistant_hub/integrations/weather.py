@@ -34,6 +34,9 @@ class WeatherAdapter:
             backoff_factor=config.backoff_factor,
         )
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     async def fetch_weather(self, *, location: str, units: str) -> Dict[str, Any]:
         if not self.config.api_key:
             raise ToolExecutionError("Weather API key not configured. Set TOOL_WEATHER_CONFIG__API_KEY")
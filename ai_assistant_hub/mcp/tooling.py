@@ -1,24 +1,27 @@
 """Utilities for registering tools with the official MCP server."""
 from __future__ import annotations
 
+import copy
+import functools
+import inspect
+import sys
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from ..schemas.base import ToolInvocationRequest, ToolInvocationResponse
 from ..utils.errors import ToolExecutionError
 
-try:  # pragma: no cover - optional dependency runtime check
-    from mcp import types as mcp_types  # type: ignore
-except Exception:  # pragma: no cover - handled gracefully at runtime
-    mcp_types = None  # type: ignore
-
 
 ToolHandler = Callable[[BaseModel, Optional[Any]], Awaitable[Any]]
 
+# Keyword names MCP server variants use for tool arguments, in priority order.
+_ARGUMENT_KEYS = ("arguments", "input", "params")
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolSpec:
     """In-memory representation of an MCP tool."""
 
@@ -27,123 +30,72 @@ class ToolSpec:
     input_model: type[BaseModel]
     output_model: type[BaseModel]
     handler: ToolHandler
+    close: Optional[Callable[[], Awaitable[None]]] = None
+    _input_adapter: TypeAdapter[Any] = field(init=False, repr=False, compare=False)
+    _output_adapter: TypeAdapter[Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+        # Built once per tool so each invocation reuses the compiled validators.
+        self._input_adapter = TypeAdapter(self.input_model)
+        self._output_adapter = TypeAdapter(self.output_model)
 
     def to_metadata(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
-            "input_schema": self.input_model.model_json_schema(),
-            "output_schema": self.output_model.model_json_schema(),
+            "input_schema": _json_schema(self.input_model),
+            "output_schema": _json_schema(self.output_model),
         }
 
     def bind_to_server(self, server: Any) -> None:
         """Register the tool with the official MCP server instance."""
 
-        if mcp_types is None:
+        if _mcp_types() is None:
             raise RuntimeError("The 'mcp' package is required but not installed")
 
+        # The registration API is detected once per server and reused for later tools.
+        registrar = _cached_registrar(server)
+        if registrar is None:
+            registrar = _resolve_registrar(server)
+            if registrar is None:
+                raise RuntimeError("Incompatible MCP server: missing tool registration API")
+            _remember_registrar(server, registrar)
+        registrar(self, server)
+
+    def _mcp_handler(self) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        """Build a handler for servers that pass raw arguments and context."""
+
         async def mcp_handler(*args: Any, **kwargs: Any) -> Dict[str, Any]:
             arguments, context = _extract_invocation_payload(args, kwargs)
-            payload = self.input_model.model_validate(arguments)
+            payload = self._input_adapter.validate_python(arguments)
             context_payload = context if isinstance(context, dict) else None
             result = await self.handler(payload, context_payload)
+            return self._dump_output(result)
+
+        return mcp_handler
+
+    def _fastmcp_handler(self) -> Callable[[Any], Awaitable[Any]]:
+        """Build a handler whose annotations let FastMCP infer the tool schema."""
+
+        async def fastmcp_handler(input_data: Any) -> Any:  # type: ignore
+            """Wrapper for FastMCP tool registration."""
+            # Validate input using the Pydantic model
+            validated_input = self._input_adapter.validate_python(input_data)
+            result = await self.handler(validated_input, None)
             if isinstance(result, BaseModel):
-                return result.model_dump()
-            return self.output_model.model_validate(result).model_dump()
-
-        input_schema = self.input_model.model_json_schema()
-        output_schema = self.output_model.model_json_schema()
-
-        add_tool = getattr(server, "add_tool", None)
-        if callable(add_tool):
-            try:
-                # FastMCP (mcp >= 1.20.0) expects function as first arg
-                # Use Pydantic model as type annotation so FastMCP can infer schema
-                input_model_cls = self.input_model
-                output_model_cls = self.output_model
-                
-                async def fastmcp_handler(input_data: Any) -> Any:  # type: ignore
-                    """Wrapper for FastMCP tool registration."""
-                    # Validate input using the Pydantic model
-                    validated_input = input_model_cls.model_validate(input_data)
-                    result = await self.handler(validated_input, None)
-                    if isinstance(result, BaseModel):
-                        return result  # type: ignore
-                    return output_model_cls.model_validate(result)
-                
-                # Set type annotations dynamically for FastMCP schema inference
-                fastmcp_handler.__annotations__ = {
-                    'input_data': input_model_cls,
-                    'return': output_model_cls,
-                }
-                
-                # Try FastMCP API (function as first argument)
-                add_tool(
-                    fastmcp_handler,
-                    name=self.name,
-                    description=self.description,
-                )
-                return
-            except TypeError:
-                # Fallback: try old API with keyword arguments
-                try:
-                    add_tool(
-                        name=self.name,
-                        description=self.description,
-                        input_schema=input_schema,
-                        output_schema=output_schema,
-                        handler=mcp_handler,
-                    )
-                    return
-                except (TypeError, Exception):
-                    pass
-            except Exception:  # pragma: no cover - compatibility shim
-                if mcp_types is not None:
-                    tool_cls = getattr(mcp_types, "Tool", None) or getattr(
-                        mcp_types, "ToolDefinition", None
-                    )
-                    if tool_cls is not None:
-                        try:
-                            tool_obj = tool_cls(
-                                name=self.name,
-                                description=self.description,
-                                input_schema=input_schema,
-                                output_schema=output_schema,
-                            )
-                            add_tool(tool_obj, mcp_handler)
-                            return
-                        except Exception:
-                            pass
-
-        register_tool = getattr(server, "register_tool", None)
-        if callable(register_tool):
-            try:
-                register_tool(
-                    name=self.name,
-                    description=self.description,
-                    input_schema=input_schema,
-                    output_schema=output_schema,
-                    handler=mcp_handler,
-                )
-                return
-            except Exception:
-                pass
-
-        tool_decorator = getattr(server, "tool", None)
-        if callable(tool_decorator):
-            decorated = tool_decorator(
-                name=self.name,
-                description=self.description,
-                input_schema=input_schema,
-                output_schema=output_schema,
-            )
-            decorated(mcp_handler)
-            return
-
-        raise RuntimeError("Incompatible MCP server: missing tool registration API")
+                return result  # type: ignore
+            return self._output_adapter.validate_python(result)
+
+        # Set type annotations dynamically for FastMCP schema inference
+        fastmcp_handler.__annotations__ = {
+            'input_data': self.input_model,
+            'return': self.output_model,
+        }
+        return fastmcp_handler
 
     async def invoke(self, request: ToolInvocationRequest) -> ToolInvocationResponse:
-        payload = self.input_model.model_validate(request.input or {})
+        payload = self._input_adapter.validate_python(request.input or {})
         try:
             raw_output = await self.handler(payload, request.context)
         except ToolExecutionError as exc:
@@ -151,58 +103,185 @@ class ToolSpec:
         except Exception as exc:  # pragma: no cover - defensive
             raise ToolExecutionError(str(exc)) from exc
 
-        if isinstance(raw_output, BaseModel):
-            output_model = raw_output
-        else:
-            output_model = self.output_model.model_validate(raw_output)
+        return ToolInvocationResponse(ok=True, output=self._dump_output(raw_output))
+
+    def _dump_output(self, result: Any) -> Dict[str, Any]:
+        """Validate a handler result if needed and serialise it to a dict."""
+
+        # Only exact output_model instances use the adapter: dumping a subclass
+        # through the parent's schema would drop the subclass's extra fields.
+        if type(result) is not self.output_model:
+            if isinstance(result, BaseModel):
+                return result.model_dump()
+            result = self._output_adapter.validate_python(result)
+        return self._output_adapter.dump_python(result)
+
+
+_Registrar = Callable[[ToolSpec, Any], None]
+_REGISTRAR_CACHE: "weakref.WeakKeyDictionary[Any, _Registrar]" = weakref.WeakKeyDictionary()
+
+
+def _register_fastmcp(spec: ToolSpec, server: Any) -> None:
+    # FastMCP (mcp >= 1.20.0) expects the function as first argument
+    server.add_tool(spec._fastmcp_handler(), name=spec.name, description=spec.description)
+
+
+def _register_add_tool_kwargs(spec: ToolSpec, server: Any) -> None:
+    # Older servers accept the schemas and handler as keyword arguments
+    server.add_tool(
+        name=spec.name,
+        description=spec.description,
+        input_schema=_json_schema(spec.input_model),
+        output_schema=_json_schema(spec.output_model),
+        handler=spec._mcp_handler(),
+    )
+
+
+def _register_add_tool_object(spec: ToolSpec, server: Any) -> None:
+    # Servers that take an ``mcp.types`` tool definition plus a handler
+    mcp_types = _mcp_types()
+    tool_cls = getattr(mcp_types, "Tool", None) or getattr(mcp_types, "ToolDefinition", None)
+    if tool_cls is None:
+        raise RuntimeError("Incompatible MCP server: no tool definition type in mcp.types")
+    tool_obj = tool_cls(
+        name=spec.name,
+        description=spec.description,
+        input_schema=_json_schema(spec.input_model),
+        output_schema=_json_schema(spec.output_model),
+    )
+    server.add_tool(tool_obj, spec._mcp_handler())
+
+
+def _register_register_tool(spec: ToolSpec, server: Any) -> None:
+    server.register_tool(
+        name=spec.name,
+        description=spec.description,
+        input_schema=_json_schema(spec.input_model),
+        output_schema=_json_schema(spec.output_model),
+        handler=spec._mcp_handler(),
+    )
 
-        return ToolInvocationResponse(ok=True, output=output_model.model_dump())
+
+def _register_tool_decorator(spec: ToolSpec, server: Any) -> None:
+    decorated = server.tool(
+        name=spec.name,
+        description=spec.description,
+        input_schema=_json_schema(spec.input_model),
+        output_schema=_json_schema(spec.output_model),
+    )
+    decorated(spec._mcp_handler())
+
+
+def _resolve_registrar(server: Any) -> Optional[_Registrar]:
+    """Pick the registration strategy matching the server's tool API."""
+
+    add_tool = getattr(server, "add_tool", None)
+    if callable(add_tool):
+        return _add_tool_registrar(add_tool)
+    if callable(getattr(server, "register_tool", None)):
+        return _register_register_tool
+    if callable(getattr(server, "tool", None)):
+        return _register_tool_decorator
+    return None
+
+
+def _add_tool_registrar(add_tool: Callable[..., Any]) -> _Registrar:
+    # FastMCP's positional call is the default; other strategies are only
+    # chosen when the signature unambiguously asks for them.
+    params = _parameters(add_tool)
+    if params is None:
+        return _register_fastmcp
+    names = {param.name for param in params}
+    if "handler" in names and "name" in names:
+        return _register_add_tool_kwargs
+    if "name" in names or any(param.kind is param.VAR_KEYWORD for param in params):
+        return _register_fastmcp
+    positional = [param for param in params if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)]
+    if len(positional) >= 2:
+        return _register_add_tool_object
+    return _register_fastmcp
+
+
+def _parameters(func: Callable[..., Any]) -> Optional[Tuple[inspect.Parameter, ...]]:
+    try:
+        return tuple(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):  # pragma: no cover - builtins without signatures
+        return None
+
+
+def _cached_registrar(server: Any) -> Optional[_Registrar]:
+    try:
+        return _REGISTRAR_CACHE.get(server)
+    except TypeError:  # pragma: no cover - server not weak-referenceable
+        return None
+
+
+def _remember_registrar(server: Any, registrar: _Registrar) -> None:
+    try:
+        _REGISTRAR_CACHE[server] = registrar
+    except TypeError:  # pragma: no cover - server not weak-referenceable
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _mcp_types() -> Any:
+    """Import ``mcp.types`` on first use; ``None`` when the package is missing."""
+
+    try:  # pragma: no cover - optional dependency runtime check
+        from mcp import types as mcp_types  # type: ignore
+    except Exception:  # pragma: no cover - handled gracefully at runtime
+        return None
+    return mcp_types
+
+
+def _json_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    """Return a private copy of a model's JSON schema.
+
+    Schemas are handed to callers and MCP servers that may edit them in place,
+    so the memoised schema itself never leaves this module.
+    """
+
+    return copy.deepcopy(_cached_json_schema(model))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_json_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    return model.model_json_schema()
 
 
 def _extract_invocation_payload(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Any]]:
     """Normalize invocation payloads from the official MCP server."""
 
-    context: Optional[Any] = None
-    arguments: Optional[Dict[str, Any]] = None
+    context: Optional[Any] = kwargs.get("context")
+    arguments: Any = None
 
-    if "arguments" in kwargs:
-        arguments = kwargs.get("arguments")
-    elif "input" in kwargs:
-        arguments = kwargs.get("input")
-    elif "params" in kwargs:
-        arguments = kwargs.get("params")
-
-    if "context" in kwargs:
-        context = kwargs.get("context")
+    if kwargs:
+        for key in _ARGUMENT_KEYS:
+            if key in kwargs:
+                arguments = kwargs[key]
+                break
 
     if arguments is None and args:
-        if isinstance(args[0], dict):
-            arguments = args[0]
+        first = args[0]
+        if isinstance(first, dict):
+            arguments = first
             if len(args) > 1:
                 context = args[1]
         else:
-            context = args[0]
+            context = first
             if len(args) > 1:
-                candidate = args[1]
-                if isinstance(candidate, dict):
-                    arguments = candidate
-                elif hasattr(candidate, "model_dump"):
-                    arguments = candidate.model_dump()
-                else:
-                    arguments = candidate
+                arguments = args[1]
 
     if arguments is None:
-        arguments = {}
-
-    if not isinstance(arguments, dict) and hasattr(arguments, "model_dump"):
-        arguments = arguments.model_dump()
-    elif not isinstance(arguments, dict):
-        try:
-            arguments = dict(arguments)  # type: ignore[arg-type]
-        except Exception:  # pragma: no cover - defensive casting
-            arguments = {"value": arguments}
-
-    return arguments, context
+        return {}, context
+    if isinstance(arguments, dict):
+        return arguments, context
+    if hasattr(arguments, "model_dump"):
+        return arguments.model_dump(), context
+    try:
+        return dict(arguments), context  # type: ignore[arg-type]
+    except Exception:  # pragma: no cover - defensive casting
+        return {"value": arguments}, context
 
 
 @dataclass
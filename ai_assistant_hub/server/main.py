@@ -11,7 +11,7 @@ from typing import Awaitable, Callable, Dict
 from ..config.settings import load_settings
 from ..utils.logging import configure_logging
 from .mcp_server import AIHubMCPServer
-from .tool_loader import load_tools
+from .tool_loader import load_tools_async
 
 TransportRunner = Callable[[object], Awaitable[None]]
 DEFAULT_TRANSPORT = "stdio"
@@ -25,7 +25,7 @@ async def create_mcp_server() -> tuple[AIHubMCPServer, object]:
     configure_logging(settings)
 
     server = AIHubMCPServer(settings=settings)
-    load_tools(server, settings=settings)
+    await load_tools_async(server, settings=settings)
     server.log_startup()
 
     return server, server.mcp_server
@@ -72,14 +72,15 @@ async def _run_cli(*, transport: str) -> None:
         print(f"MCP server started with {transport} transport. Waiting for client...", file=sys.stderr)
         print(f"Tools available: {[t.name for t in _server_wrapper.list_tools()]}", file=sys.stderr)
 
-        try:
-            await runner(mcp_server)
-        except asyncio.CancelledError:  
-            raise
-        except KeyboardInterrupt:  
-            logger.info("Received interrupt, shutting down transport")
-        finally:
-            logger.info("Transport %s stopped", transport)
+        async with _server_wrapper:
+            try:
+                await runner(mcp_server)
+            except asyncio.CancelledError:  
+                raise
+            except KeyboardInterrupt:  
+                logger.info("Received interrupt, shutting down transport")
+            finally:
+                logger.info("Transport %s stopped", transport)
     except Exception as e:
         
         logger = logging.getLogger("aihub.cli")
@@ -1,9 +1,14 @@
 """Server abstraction for handling MCP interactions."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+
+from pydantic import BaseModel, Field
 
 try:  # pragma: no cover - optional dependency runtime check
     try:
@@ -23,6 +28,11 @@ from ..mcp.tooling import ToolCatalog, ToolSpec
 from ..schemas.base import ToolInvocationRequest, ToolInvocationResponse
 from ..utils.errors import ToolExecutionError
 
+BATCH_TOOL_NAME = "batch_execute"
+BUILTIN_TOOLS = frozenset((BATCH_TOOL_NAME,))
+
+ToolInvoker = Callable[[ToolInvocationRequest], Awaitable[ToolInvocationResponse]]
+
 
 @dataclass
 class AIHubMCPServer:
@@ -32,6 +42,11 @@ class AIHubMCPServer:
     mcp_server: Any = field(init=False)
     catalog: ToolCatalog = field(default_factory=ToolCatalog)
     logger: logging.Logger = field(default_factory=lambda: logging.getLogger("aihub.mcp"))
+    _metadata_cache: Optional[Mapping[str, Any]] = field(default=None, init=False, repr=False)
+    # Tool name -> bound ``ToolSpec.invoke``, so dispatch is a single dict lookup.
+    _dispatch: Dict[str, ToolInvoker] = field(default_factory=dict, init=False, repr=False)
+    # Cleanup callbacks (e.g. HTTP pool shutdown) pushed as tools register.
+    _exit_stack: AsyncExitStack = field(default_factory=AsyncExitStack, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if MCPServer is None:  
@@ -55,23 +70,46 @@ class AIHubMCPServer:
 
         self.mcp_server = server
 
+        if self.settings.tool_is_enabled(BATCH_TOOL_NAME):
+            self.register_tool(build_batch_tool(self))
+
     def register_tool(self, spec: ToolSpec) -> None:
         self.catalog.register(spec)
         spec.bind_to_server(self.mcp_server)
-        self.logger.debug("Registered MCP tool %s", spec.name)
+        self._dispatch[spec.name] = spec.invoke
+        if spec.close is not None:
+            self._exit_stack.push_async_callback(spec.close)
+        self._metadata_cache = None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Registered MCP tool %s", spec.name)
 
     async def invoke(self, request: ToolInvocationRequest) -> ToolInvocationResponse:
-        spec = self.catalog.get(request.tool)
-        if not spec:
+        invoke = self._dispatch.get(request.tool)
+        if invoke is None:
             raise ToolExecutionError(f"Unknown tool: {request.tool}")
-        return await spec.invoke(request)
+        return await invoke(request)
 
     def list_tools(self) -> List[ToolSpec]:
         return self.catalog.list()
 
-    def metadata(self) -> Dict[str, Any]:
-        name = getattr(self.mcp_server, "name", self.settings.app_name)
-        return {"app_name": name, "tool_count": len(self.catalog.tools)}
+    def metadata(self) -> Mapping[str, Any]:
+        # Rebuilt only after a tool registration; the view is read-only so callers cannot skew it.
+        if self._metadata_cache is None:
+            name = getattr(self.mcp_server, "name", self.settings.app_name)
+            self._metadata_cache = MappingProxyType({"app_name": name, "tool_count": len(self.catalog.tools)})
+        return self._metadata_cache
+
+    async def __aenter__(self) -> "AIHubMCPServer":
+        await self._exit_stack.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release resources (such as HTTP connection pools) held by tools."""
+
+        await self._exit_stack.aclose()
 
     def log_startup(self) -> None:
         meta = self.metadata()
@@ -82,5 +120,87 @@ class AIHubMCPServer:
         )
 
 
-__all__ = ["AIHubMCPServer"]
+class BatchCall(BaseModel):
+    tool: str = Field(description="Name of the tool to invoke")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Input arguments for the tool")
+
+
+class BatchExecuteInput(BaseModel):
+    calls: List[BatchCall] = Field(description="Tool calls to execute in a single round trip")
+    max_concurrent: int = Field(default=5, ge=1, description="Maximum number of calls running at once")
+    stop_on_error: bool = Field(default=False, description="Cancel outstanding calls after the first failure")
+    timeout_ms: Optional[int] = Field(default=None, gt=0, description="Per-call timeout in milliseconds")
+
+
+class BatchExecuteOutput(BaseModel):
+    results: List[Dict[str, Any]] = Field(default_factory=list, description="Successful calls with their output")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="Failed or cancelled calls")
+
+
+def build_batch_tool(server: AIHubMCPServer) -> ToolSpec:
+    """Create the built-in tool that fans several tool calls out concurrently."""
+
+    async def handler(payload: BatchExecuteInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
+        semaphore = asyncio.Semaphore(payload.max_concurrent)
+        timeout = payload.timeout_ms / 1000 if payload.timeout_ms else None
+        context_payload = context if isinstance(context, dict) else None
+
+        async def run(call: BatchCall) -> Dict[str, Any]:
+            if call.tool == BATCH_TOOL_NAME:
+                raise ToolExecutionError(f"{BATCH_TOOL_NAME} cannot be called from within a batch")
+            invoke = server._dispatch.get(call.tool)
+            if invoke is None:
+                raise ToolExecutionError(f"Unknown tool: {call.tool}")
+            request = ToolInvocationRequest(tool=call.tool, input=call.payload, context=context_payload)
+            async with semaphore:
+                response = await asyncio.wait_for(invoke(request), timeout)
+            if not response.ok:
+                raise ToolExecutionError(response.error or f"Tool {call.tool} failed")
+            return response.output
+
+        tasks = [asyncio.create_task(run(call)) for call in payload.calls]
+        try:
+            if tasks and payload.stop_on_error:
+                _done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            elif tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        results: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for index, (call, task) in enumerate(zip(payload.calls, tasks)):
+            if task.cancelled():
+                errors.append({"index": index, "tool": call.tool, "error": "Cancelled after an earlier call failed"})
+                continue
+            exc = task.exception()
+            if exc is None:
+                results.append({"index": index, "tool": call.tool, "output": task.result()})
+            elif isinstance(exc, TimeoutError):
+                errors.append({"index": index, "tool": call.tool, "error": f"Timed out after {payload.timeout_ms} ms"})
+            else:
+                errors.append({"index": index, "tool": call.tool, "error": str(exc) or type(exc).__name__})
+
+        return {"results": results, "errors": errors}
+
+    description = (
+        "Execute several tool calls in one request. Calls run concurrently up to max_concurrent; "
+        "set stop_on_error to cancel outstanding calls after the first failure."
+    )
+
+    return ToolSpec(
+        name=BATCH_TOOL_NAME,
+        description=description,
+        input_model=BatchExecuteInput,
+        output_model=BatchExecuteOutput,
+        handler=handler,
+    )
+
+
+__all__ = ["AIHubMCPServer", "BATCH_TOOL_NAME", "BUILTIN_TOOLS", "build_batch_tool"]
 
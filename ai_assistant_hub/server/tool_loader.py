@@ -1,37 +1,75 @@
 """Tool discovery and registration utilities."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
-from typing import Callable, Dict
+import inspect
+import logging
+import sys
+from typing import Callable, Dict, List, Tuple
 
 from ..config.settings import Settings
 from ..mcp.tooling import ToolSpec
 from ..utils.errors import ConfigurationError
-from .mcp_server import AIHubMCPServer
+from .mcp_server import BUILTIN_TOOLS, AIHubMCPServer
 
 
 ToolFactory = Callable[[Dict[str, object]], ToolSpec]
 
 
 def load_tools(server: AIHubMCPServer, *, settings: Settings) -> None:
-    """Load and register tools declared in the settings."""
+    """Load and register tools declared in the settings.
 
+    Synchronous wrapper around :func:`load_tools_async` for callers that are
+    not already running an event loop.
+    """
+
+    asyncio.run(load_tools_async(server, settings=settings))
+
+
+async def load_tools_async(server: AIHubMCPServer, *, settings: Settings) -> None:
+    """Build enabled tools concurrently, then register them in declaration order."""
+
+    selected: List[Tuple[str, Dict[str, object]]] = []
     for tool_name, toggle in settings.enabled_tools.items():
+        if tool_name in BUILTIN_TOOLS:
+            # Built-in tools are registered by the server itself.
+            continue
         if not toggle.enabled:
-            server.logger.debug("Tool %s disabled via configuration", tool_name)
+            if server.logger.isEnabledFor(logging.DEBUG):
+                server.logger.debug("Tool %s disabled via configuration", tool_name)
             continue
+        selected.append((tool_name, toggle.config))
+
+    tasks = [asyncio.create_task(_build_tool_spec(tool_name, config)) for tool_name, config in selected]
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
 
-        factory = _import_tool_factory(tool_name)
-        spec = factory(toggle.config)
+    for spec in outcomes:
         server.register_tool(spec)
 
 
+async def _build_tool_spec(tool_name: str, config: Dict[str, object]) -> ToolSpec:
+    # Module imports and factories may block, so both run on the default executor.
+    loop = asyncio.get_running_loop()
+    factory = await loop.run_in_executor(None, _import_tool_factory, tool_name)
+    if inspect.iscoroutinefunction(factory):
+        return await factory(config)
+    return await loop.run_in_executor(None, factory, config)
+
+
+@functools.lru_cache(maxsize=None)
 def _import_tool_factory(tool_name: str) -> ToolFactory:
     module_name = f"ai_assistant_hub.tools.{tool_name}"
-    try:
-        module = importlib.import_module(module_name)
-    except ModuleNotFoundError as exc:  
-        raise ConfigurationError(f"Tool module not found: {module_name}") from exc
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError as exc:
+            raise ConfigurationError(f"Tool module not found: {module_name}") from exc
 
     if not hasattr(module, "build_tool"):
         raise ConfigurationError(f"Tool module {module_name} missing build_tool")
@@ -42,5 +80,11 @@ def _import_tool_factory(tool_name: str) -> ToolFactory:
     return factory
 
 
-__all__ = ["load_tools"]
+def _clear_factory_cache() -> None:
+    """Forget resolved tool factories (for tests that swap tool modules)."""
+
+    _import_tool_factory.cache_clear()
+
+
+__all__ = ["load_tools", "load_tools_async"]
 
@@ -1,7 +1,9 @@
 """GitHub issues tool registration."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -9,6 +11,10 @@ from ..integrations.github import GitHubIssuesAdapter, GitHubIssuesConfig
 from ..mcp.tooling import ToolSpec
 from ..utils.errors import ToolExecutionError
 
+REPOSITORY_CHECK_TTL_SECONDS = 300.0
+REPOSITORY_CHECK_MAX_ENTRIES = 1024
+_VALID_STATES = frozenset(("open", "closed", "all"))
+
 
 class GitHubIssuesInput(BaseModel):
     owner: str = Field(description="GitHub organization or user")
@@ -30,14 +36,31 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
 
     config = GitHubIssuesConfig.model_validate(raw_config)
     adapter = GitHubIssuesAdapter(config=config)
+    # (owner, repo) -> monotonic time of the last successful existence check,
+    # kept in check-time order so expired entries are always at the front.
+    validated: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+    ensure_repository = adapter.ensure_repository
+    list_issues = adapter.list_issues
 
     async def handler(payload: GitHubIssuesInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
-        state = (payload.state or "open").lower()
-        if state not in {"open", "closed", "all"}:
-            raise ToolExecutionError("Invalid issue state. Choose 'open', 'closed', or 'all'.")
-
-        await adapter.ensure_repository(payload.owner, payload.repo)
-        issues = await adapter.list_issues(
+        state = payload.state or "open"
+        if state not in _VALID_STATES:
+            lowered = state.lower()
+            if lowered not in _VALID_STATES:
+                raise ToolExecutionError("Invalid issue state. Choose 'open', 'closed', or 'all'.")
+            state = lowered
+
+        key = (payload.owner.lower(), payload.repo.lower())
+        now = time.monotonic()
+        if now - validated.get(key, float("-inf")) >= REPOSITORY_CHECK_TTL_SECONDS:
+            await ensure_repository(payload.owner, payload.repo)
+            validated[key] = now
+            validated.move_to_end(key)
+            while len(validated) > REPOSITORY_CHECK_MAX_ENTRIES or (
+                now - next(iter(validated.values())) >= REPOSITORY_CHECK_TTL_SECONDS
+            ):
+                validated.popitem(last=False)
+        issues = await list_issues(
             owner=payload.owner,
             repo=payload.repo,
             state=state,
@@ -64,6 +87,7 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
         input_model=GitHubIssuesInput,
         output_model=GitHubIssuesOutput,
         handler=handler,
+        close=adapter.aclose,
     )
 
 
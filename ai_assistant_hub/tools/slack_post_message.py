@@ -1,6 +1,7 @@
 """Slack post message tool registration."""
 from __future__ import annotations
 
+import functools
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -28,10 +29,11 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
 
     config = SlackConfig.model_validate(raw_config)
     adapter = SlackAdapter(config=config)
+    post_message = adapter.post_message
 
     async def handler(payload: SlackPostMessageInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
-        channel = payload.channel[1:] if payload.channel.startswith("#") else payload.channel
-        result = await adapter.post_message(channel=channel, text=payload.text, thread_ts=payload.thread_ts)
+        channel = _normalize_channel(payload.channel)
+        result = await post_message(channel=channel, text=payload.text, thread_ts=payload.thread_ts)
         return result
 
     description = (
@@ -44,8 +46,16 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
         input_model=SlackPostMessageInput,
         output_model=SlackPostMessageOutput,
         handler=handler,
+        close=adapter.aclose,
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalize_channel(raw: str) -> str:
+    """Strip the leading '#' from channel names; IDs pass through unchanged."""
+
+    return raw[1:] if raw.startswith("#") else raw
+
+
 __all__ = ["build_tool", "SlackPostMessageInput", "SlackPostMessageOutput"]
 
@@ -9,6 +9,8 @@ from ..integrations.weather import WeatherAdapter, WeatherConfig
 from ..mcp.tooling import ToolSpec
 from ..utils.errors import ToolExecutionError
 
+_VALID_UNITS = frozenset(("metric", "imperial"))
+
 
 class WeatherInput(BaseModel):
     location: str = Field(description="City name (e.g., 'London', 'New York')")
@@ -24,13 +26,17 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
 
     config = WeatherConfig.model_validate(raw_config)
     adapter = WeatherAdapter(config=config)
+    fetch_weather = adapter.fetch_weather
 
     async def handler(payload: WeatherInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
-        units = payload.units.lower()
-        if units not in {"metric", "imperial"}:
-            raise ToolExecutionError("Invalid unit system. Choose 'metric' or 'imperial'.")
-
-        conditions = await adapter.fetch_weather(location=payload.location, units=units)
+        units = payload.units
+        if units not in _VALID_UNITS:
+            lowered = units.lower()
+            if lowered not in _VALID_UNITS:
+                raise ToolExecutionError("Invalid unit system. Choose 'metric' or 'imperial'.")
+            units = lowered
+
+        conditions = await fetch_weather(location=payload.location, units=units)
         return {"conditions": conditions}
 
     description = "Retrieve current weather information for a specified city using OpenWeatherMap API."
@@ -41,6 +47,7 @@ def build_tool(raw_config: Dict[str, object]) -> ToolSpec:
         input_model=WeatherInput,
         output_model=WeatherOutput,
         handler=handler,
+        close=adapter.aclose,
     )
 
 
@@ -1,38 +1,62 @@
 """Authentication helpers and placeholders."""
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Protocol
 
 
-class AuthStrategy(ABC):
-    """Base class for authentication strategies."""
+class AuthStrategy(Protocol):
+    """Interface implemented by authentication strategies."""
 
-    @abstractmethod
-    def headers(self) -> Dict[str, str]:
+    def headers(self) -> Mapping[str, str]:
         """Return HTTP headers containing authentication information."""
 
 
-class APIKeyAuth(AuthStrategy):
+class APIKeyAuth:
     """Simple API key authentication."""
 
+    __slots__ = ("_header_name", "_api_key", "_headers")
+
     def __init__(self, header_name: str, api_key: str) -> None:
-        self.header_name = header_name
-        self.api_key = api_key
+        self._header_name = header_name
+        self._api_key = api_key
+        self._headers: Mapping[str, str] = MappingProxyType({header_name: api_key})
+
+    # Read-only: ``headers()`` is precomputed from these values.
+    @property
+    def header_name(self) -> str:
+        return self._header_name
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
 
-    def headers(self) -> Dict[str, str]:
-        return {self.header_name: self.api_key}
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
 
 
-class OAuthTokenAuth(AuthStrategy):
+class OAuthTokenAuth:
     """Placeholder OAuth token strategy with TODO for refresh logic."""
 
-    def __init__(self, token: str, token_type: str = "Bearer") -> None:
-        self.token = token
-        self.token_type = token_type
+    __slots__ = ("_token", "_token_type", "_value", "_headers")
 
-    def headers(self) -> Dict[str, str]:
-        return {"Authorization": f"{self.token_type} {self.token}"}
+    def __init__(self, token: str, token_type: str = "Bearer") -> None:
+        self._token = token
+        self._token_type = token_type
+        self._value = f"{token_type} {token}"
+        self._headers: Mapping[str, str] = MappingProxyType({"Authorization": self._value})
+
+    # Read-only: a refreshed token means a new instance, never stale headers.
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @property
+    def token_type(self) -> str:
+        return self._token_type
+
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
 
 
 __all__ = ["AuthStrategy", "APIKeyAuth", "OAuthTokenAuth"]
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
-from typing import Any, Dict, Optional
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Union
 
 from .errors import ToolExecutionError
 
@@ -12,8 +16,19 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     httpx = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 logger = logging.getLogger("aihub.http")
 
+# httpx only speaks HTTP/2 when the optional 'h2' package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_RETRYABLE_STATUS_CODES = frozenset((429, 503))
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
 
 class ResilientAsyncHTTPClient:
     """Async HTTP client with retry and timeout management."""
@@ -26,12 +41,57 @@ class ResilientAsyncHTTPClient:
         timeout: Optional[float] = None,
         retries: int = 0,
         backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_per_host: int = 10,
+        http2: bool = True,
+        verify: Union[bool, str] = True,
     ) -> None:
         self.base_url = base_url
         self.headers = headers or {}
         self.timeout = timeout
         self.retries = max(retries, 0)
         self.backoff_factor = max(backoff_factor, 0)
+        self.max_backoff = max(max_backoff, 0)
+        self.max_per_host = max(max_per_host, 1)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.verify = verify
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ResilientAsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections; a later request opens a new pool."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_client(self) -> "httpx.AsyncClient":
+        # One pooled client per instance keeps connections alive between requests.
+        client = self._client
+        if client is None:
+            async with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.AsyncClient(
+                        base_url=self.base_url or "",
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        http2=self.http2,
+                        verify=self.verify,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=20,
+                            max_connections=100,
+                            keepalive_expiry=60,
+                        ),
+                    )
+        return client
 
     async def request(self, method: str, url: str, **kwargs: Any) -> Any:
         if httpx is None:  # pragma: no cover - optional dependency
@@ -39,41 +99,98 @@ class ResilientAsyncHTTPClient:
 
         attempt = 0
         last_error: Optional[Exception] = None
-        while attempt <= self.retries:
+        while True:
             try:
-                async with httpx.AsyncClient(
-                    base_url=self.base_url,
-                    headers=self.headers,
-                    timeout=self.timeout,
-                ) as session:
-                    response = await session.request(method, url, **kwargs)
-                    response.raise_for_status()
-                    return response.json()
+                client = await self._get_client()
+                async with self._host_semaphore(url):
+                    response = await client.request(method, url, **kwargs)
+                response.raise_for_status()
+                return _decode_json(response)
             except httpx.HTTPStatusError as exc:
-                error_detail = _extract_error_detail(exc)
-                raise ToolExecutionError(
-                    f"API request failed: {exc.response.status_code} {exc.response.reason_phrase}. "
-                    f"Details: {error_detail}"
-                ) from exc
-            except (httpx.RequestError, httpx.TimeoutException) as exc:
+                if exc.response.status_code not in _RETRYABLE_STATUS_CODES or attempt == self.retries:
+                    raise _status_error(exc) from exc
+                sleep_for = _retry_after_seconds(exc.response)
+                if sleep_for is None:
+                    sleep_for = self._backoff(attempt)
+                elif sleep_for > self.max_backoff:
+                    # Waiting that long inside a tool call is worse than failing fast.
+                    raise _status_error(exc) from exc
+                last_error = exc
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as exc:
+                # The request never reached the server, so any method is safe to retry.
                 last_error = exc
                 if attempt == self.retries:
                     break
-                sleep_for = self.backoff_factor * (2**attempt)
+                sleep_for = self._backoff(attempt)
+            except httpx.RequestError as exc:
+                # The server may already have acted on the request (e.g. a read
+                # timeout), so only idempotent methods are retried.
+                last_error = exc
+                if attempt == self.retries or method.upper() not in _IDEMPOTENT_METHODS:
+                    break
+                sleep_for = self._backoff(attempt)
+            except Exception as exc:  # pragma: no cover - safety net
+                raise ToolExecutionError(f"Unexpected HTTP error: {exc}") from exc
+
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "HTTP request error (attempt %s/%s): %s. Retrying in %.2fs",
                     attempt + 1,
                     self.retries + 1,
-                    exc,
+                    last_error,
                     sleep_for,
                 )
-                attempt += 1
-                if sleep_for:
-                    await asyncio.sleep(sleep_for)
-            except Exception as exc:  # pragma: no cover - safety net
-                raise ToolExecutionError(f"Unexpected HTTP error: {exc}") from exc
+            attempt += 1
+            if sleep_for:
+                await asyncio.sleep(sleep_for)
+
+        raise ToolExecutionError(f"Request failed after {attempt + 1} attempts: {last_error}")
+
+    def _host_semaphore(self, url: Any) -> asyncio.Semaphore:
+        # Caps in-flight requests per host so fan-out does not trip rate limits.
+        target = httpx.URL(url)
+        if target.is_relative_url and self.base_url:
+            target = httpx.URL(self.base_url)
+        host = target.host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return semaphore
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps concurrent callers from retrying in lockstep.
+        return random.uniform(0, min(self.backoff_factor * (2**attempt), self.max_backoff))
 
-        raise ToolExecutionError(f"Request failed after {self.retries + 1} attempts: {last_error}")
+
+def _decode_json(response: "httpx.Response") -> Any:
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _status_error(exc: "httpx.HTTPStatusError") -> ToolExecutionError:
+    error_detail = _extract_error_detail(exc)
+    return ToolExecutionError(
+        f"API request failed: {exc.response.status_code} {exc.response.reason_phrase}. "
+        f"Details: {error_detail}"
+    )
+
+
+def _retry_after_seconds(response: "httpx.Response") -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, if any."""
+
+    value = (response.headers.get("retry-after") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
 
 def _extract_error_detail(exc: "httpx.HTTPStatusError") -> str:
@@ -0,0 +1,135 @@
+"""Tests for the built-in batch_execute tool."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from ai_assistant_hub.config.settings import Settings
+from ai_assistant_hub.mcp.tooling import ToolSpec
+from ai_assistant_hub.schemas.base import ToolInvocationRequest, ToolInvocationResponse
+from ai_assistant_hub.server.mcp_server import BATCH_TOOL_NAME, AIHubMCPServer
+from ai_assistant_hub.utils.errors import ToolExecutionError
+
+
+class EchoInput(BaseModel):
+    value: int = 0
+    delay: float = 0.0
+
+
+class EchoOutput(BaseModel):
+    value: int
+
+
+def _build_server() -> AIHubMCPServer:
+    server = AIHubMCPServer(settings=Settings())
+
+    async def echo(payload: EchoInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
+        if payload.delay:
+            await asyncio.sleep(payload.delay)
+        return {"value": payload.value}
+
+    async def fail(payload: EchoInput, context: Optional[Dict[str, object]]) -> Dict[str, object]:
+        raise ToolExecutionError(f"boom {payload.value}")
+
+    for name, handler in (("echo", echo), ("fail", fail)):
+        server.register_tool(
+            ToolSpec(name=name, description=name, input_model=EchoInput, output_model=EchoOutput, handler=handler)
+        )
+    return server
+
+
+def _run_batch(**batch_input: Any) -> ToolInvocationResponse:
+    server = _build_server()
+    request = ToolInvocationRequest(tool=BATCH_TOOL_NAME, input=batch_input)
+    return asyncio.run(server.invoke(request))
+
+
+def test_results_and_errors_keep_call_indexes() -> None:
+    response = _run_batch(
+        calls=[
+            {"tool": "echo", "payload": {"value": 1}},
+            {"tool": "fail", "payload": {"value": 2}},
+            {"tool": "echo", "payload": {"value": 3}},
+        ]
+    )
+
+    assert response.ok
+    assert response.output["results"] == [
+        {"index": 0, "tool": "echo", "output": {"value": 1}},
+        {"index": 2, "tool": "echo", "output": {"value": 3}},
+    ]
+    assert response.output["errors"] == [{"index": 1, "tool": "fail", "error": "boom 2"}]
+
+
+def test_unknown_tool_is_reported_per_call() -> None:
+    response = _run_batch(calls=[{"tool": "missing"}, {"tool": "echo", "payload": {"value": 7}}])
+
+    assert response.output["errors"] == [{"index": 0, "tool": "missing", "error": "Unknown tool: missing"}]
+    assert response.output["results"] == [{"index": 1, "tool": "echo", "output": {"value": 7}}]
+
+
+def test_nested_batch_call_is_rejected() -> None:
+    response = _run_batch(calls=[{"tool": BATCH_TOOL_NAME, "payload": {"calls": []}}])
+
+    assert response.output["results"] == []
+    assert response.output["errors"] == [
+        {"index": 0, "tool": BATCH_TOOL_NAME, "error": f"{BATCH_TOOL_NAME} cannot be called from within a batch"}
+    ]
+
+
+def test_stop_on_error_cancels_pending_calls() -> None:
+    started = time.monotonic()
+    response = _run_batch(
+        calls=[
+            {"tool": "echo", "payload": {"value": 1, "delay": 5}},
+            {"tool": "fail", "payload": {"value": 2}},
+        ],
+        stop_on_error=True,
+    )
+
+    assert time.monotonic() - started < 2
+    assert response.output["results"] == []
+    assert response.output["errors"] == [
+        {"index": 0, "tool": "echo", "error": "Cancelled after an earlier call failed"},
+        {"index": 1, "tool": "fail", "error": "boom 2"},
+    ]
+
+
+def test_without_stop_on_error_all_calls_finish() -> None:
+    response = _run_batch(
+        calls=[
+            {"tool": "echo", "payload": {"value": 1, "delay": 0.05}},
+            {"tool": "fail", "payload": {"value": 2}},
+        ],
+    )
+
+    assert response.output["results"] == [{"index": 0, "tool": "echo", "output": {"value": 1}}]
+    assert [error["index"] for error in response.output["errors"]] == [1]
+
+
+def test_timeout_applies_per_call() -> None:
+    response = _run_batch(
+        calls=[
+            {"tool": "echo", "payload": {"value": 1, "delay": 5}},
+            {"tool": "echo", "payload": {"value": 2}},
+        ],
+        timeout_ms=50,
+    )
+
+    assert response.output["results"] == [{"index": 1, "tool": "echo", "output": {"value": 2}}]
+    assert response.output["errors"] == [{"index": 0, "tool": "echo", "error": "Timed out after 50 ms"}]
+
+
+def test_max_concurrent_limits_parallel_calls() -> None:
+    started = time.monotonic()
+    response = _run_batch(
+        calls=[{"tool": "echo", "payload": {"value": i, "delay": 0.1}} for i in range(4)],
+        max_concurrent=2,
+    )
+    elapsed = time.monotonic() - started
+
+    assert [result["index"] for result in response.output["results"]] == [0, 1, 2, 3]
+    assert 0.2 <= elapsed < 1
@@ -0,0 +1,94 @@
+"""Tests for configuration file loading."""
+from __future__ import annotations
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from ai_assistant_hub.config import loaders
+
+
+def test_yaml_cache_hits_do_not_share_nested_state(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config = tmp_path / "c.yml"
+    config.write_text("tool_weather:\n  config:\n    api_key: abc\n")
+
+    first = loaders.load_file_config(config, use_sidecar=False)
+    first["TOOL_WEATHER"]["config"]["api_key"] = "changed"
+
+    assert loaders.load_file_config(config, use_sidecar=False)["TOOL_WEATHER"]["config"]["api_key"] == "abc"
+
+
+def test_json_config_is_read_fresh(tmp_path: Path) -> None:
+    config = tmp_path / "c.json"
+    config.write_text('{"tool_weather": {"config": {"api_key": "abc"}}}')
+
+    first = loaders.load_file_config(config)
+    first["TOOL_WEATHER"]["config"]["api_key"] = "changed"
+
+    assert loaders.load_file_config(config) == {
+        "TOOL_WEATHER": {"config": {"api_key": "abc"}},
+        "CONFIG_FILE": str(config),
+    }
+
+
+def _load_with_sidecar(config: Path) -> dict:
+    # Bypass the in-process parse cache so each call exercises the sidecar.
+    loaders._parse_yaml_file.cache_clear()
+    return loaders.load_file_config(config, use_sidecar=True)
+
+
+def test_sidecar_is_reused_for_the_same_yaml_version(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config = tmp_path / "c.yml"
+    config.write_text("app_name: from-yaml\n")
+    _load_with_sidecar(config)
+
+    sidecar = tmp_path / "c.yml.cache.json"
+    stamped = json.loads(sidecar.read_text())
+    stamped["data"]["app_name"] = "from-sidecar"
+    sidecar.write_text(json.dumps(stamped))
+
+    assert _load_with_sidecar(config)["APP_NAME"] == "from-sidecar"
+
+
+def test_sidecar_requires_an_exact_source_match(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config = tmp_path / "c.yml"
+    config.write_text("app_name: first\n")
+    _load_with_sidecar(config)
+    first_stat = config.stat()
+
+    # Replace the YAML with a copy carrying an older mtime (as ``cp -p`` would).
+    config.write_text("app_name: other\n")
+    older = first_stat.st_mtime_ns - 10_000_000_000
+    os.utime(config, ns=(older, older))
+
+    assert _load_with_sidecar(config)["APP_NAME"] == "other"
+
+
+def test_sidecar_is_skipped_when_json_would_change_keys(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config = tmp_path / "c.yml"
+    config.write_text("ports:\n  80: http\n  443: https\nflags:\n  on: 1\n")
+
+    first = _load_with_sidecar(config)
+    second = _load_with_sidecar(config)
+
+    assert first["PORTS"] == {80: "http", 443: "https"}
+    assert second == first
+    assert not (tmp_path / "c.yml.cache.json").exists()
+
+
+def test_sidecar_keeps_the_yaml_permissions(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    config = tmp_path / "c.yml"
+    config.write_text("token: secret\n")
+    config.chmod(0o600)
+
+    _load_with_sidecar(config)
+
+    assert stat.S_IMODE((tmp_path / "c.yml.cache.json").stat().st_mode) == 0o600
@@ -0,0 +1,127 @@
+"""Tests for ToolSpec metadata, serialisation and server registration."""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from ai_assistant_hub.mcp import tooling
+from ai_assistant_hub.mcp.tooling import ToolSpec
+
+
+class EchoInput(BaseModel):
+    value: int = 0
+
+
+class EchoOutput(BaseModel):
+    value: int
+
+
+async def _echo(payload: EchoInput, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"value": payload.value}
+
+
+def _spec(name: str = "echo") -> ToolSpec:
+    return ToolSpec(name=name, description=name, input_model=EchoInput, output_model=EchoOutput, handler=_echo)
+
+
+def test_metadata_schemas_are_independent_copies() -> None:
+    first = _spec("first").to_metadata()
+    first["input_schema"]["title"] = "changed"
+    first["output_schema"]["properties"].pop("value")
+
+    second = _spec("second").to_metadata()
+    assert second["input_schema"]["title"] == "EchoInput"
+    assert "value" in second["output_schema"]["properties"]
+
+
+class ExtendedOutput(EchoOutput):
+    extra: str = "kept"
+
+
+def test_dump_output_keeps_subclass_fields() -> None:
+    spec = _spec()
+
+    assert spec._dump_output(EchoOutput(value=1)) == {"value": 1}
+    assert spec._dump_output(ExtendedOutput(value=1)) == {"value": 1, "extra": "kept"}
+    assert spec._dump_output({"value": 2}) == {"value": 2}
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], Dict[str, Any]]] = []
+
+
+class FastMCPStub(_Recorder):
+    def add_tool(self, fn: Any, name: Optional[str] = None, description: Optional[str] = None) -> None:
+        self.calls.append(((fn,), {"name": name, "description": description}))
+
+
+class WrappedAddToolStub(_Recorder):
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((args, kwargs))
+
+
+class VarArgsAddToolStub(_Recorder):
+    def add_tool(self, *args: Any) -> None:
+        self.calls.append((args, {}))
+
+
+class KeywordAddToolStub(_Recorder):
+    def add_tool(self, *, name: str, description: str, input_schema: Any, output_schema: Any, handler: Any) -> None:
+        self.calls.append(((), {"name": name, "handler": handler}))
+
+
+class ObjectAddToolStub(_Recorder):
+    def add_tool(self, tool: Any, handler: Any) -> None:
+        self.calls.append(((tool, handler), {}))
+
+
+class RegisterToolStub(_Recorder):
+    def register_tool(self, **kwargs: Any) -> None:
+        self.calls.append(((), kwargs))
+
+
+class DecoratorStub(_Recorder):
+    def tool(self, **kwargs: Any) -> Any:
+        def decorate(fn: Any) -> Any:
+            self.calls.append(((fn,), kwargs))
+            return fn
+
+        return decorate
+
+
+@pytest.mark.parametrize(
+    ("server_cls", "expected"),
+    [
+        (FastMCPStub, tooling._register_fastmcp),
+        (WrappedAddToolStub, tooling._register_fastmcp),
+        (VarArgsAddToolStub, tooling._register_fastmcp),
+        (KeywordAddToolStub, tooling._register_add_tool_kwargs),
+        (ObjectAddToolStub, tooling._register_add_tool_object),
+        (RegisterToolStub, tooling._register_register_tool),
+        (DecoratorStub, tooling._register_tool_decorator),
+    ],
+)
+def test_resolve_registrar_matches_server_api(server_cls: type, expected: Any) -> None:
+    assert tooling._resolve_registrar(server_cls()) is expected
+
+
+@pytest.mark.parametrize(
+    "server_cls",
+    [FastMCPStub, WrappedAddToolStub, KeywordAddToolStub, RegisterToolStub, DecoratorStub],
+)
+def test_bind_to_server_registers_once(server_cls: type) -> None:
+    server = server_cls()
+
+    _spec().bind_to_server(server)
+
+    assert len(server.calls) == 1
+    args, kwargs = server.calls[0]
+    assert kwargs.get("name", "echo") == "echo"
+    assert any(callable(arg) for arg in (*args, *kwargs.values()))
+
+
+def test_resolve_registrar_rejects_servers_without_tool_api() -> None:
+    assert tooling._resolve_registrar(object()) is None